@@ -91,22 +91,32 @@ global_data = {
 }
 
 
+def new_chat_data():
+    """
+    Returns a fresh, empty chat data structure.
+    Built from a literal on each call so no nested containers are shared between chats.
+    """
+    return {
+        "player_stats": {},
+        "match_counter": 1,
+        "match_history": [],
+        "group_admins": [],
+        "consecutive_idle_matches": 0,  # Counter for idle matches
+    }
+
+
 def get_chat_data_for_id(chat_id: int):
     """
     Retrieves or initializes the chat-specific data from global_data.
     This ensures that each chat maintains its own game state, player scores, etc.
     """
     chat_id_str = str(chat_id)  # Convert to string to match JSON serialization
-    if chat_id_str not in global_data["all_chat_data"]:
+    all_chat_data = global_data["all_chat_data"]
+    chat_data = all_chat_data.get(chat_id_str)
+    if chat_data is None:
         # Only initialize if data doesn't exist - don't overwrite loaded data
-        global_data["all_chat_data"][chat_id_str] = {
-            "player_stats": {},
-            "match_counter": 1,
-            "match_history": [],
-            "group_admins": [],
-            "consecutive_idle_matches": 0,  # Counter for idle matches
-        }
-    return global_data["all_chat_data"][chat_id_str]
+        chat_data = all_chat_data[chat_id_str] = new_chat_data()
+    return chat_data
 
 
 def get_admin_data(admin_id: int, chat_id: int, username: str = "Unknown Admin"):
@@ -30,7 +30,7 @@ class DatabaseAdapter:
         """Get user's referral points."""
         if self.use_database:
             points = self.db_queries.get_user_referral_points(user_id)
-            logger.debug(f"Retrieved referral points for user {user_id}: {points}")
+            logger.debug("Retrieved referral points for user %s: %s", user_id, points)
             return points
         else:
             data = self.load_data()
@@ -349,10 +349,11 @@ async def check_user_score(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             # Check if it's a username
             elif user_identifier.startswith('@'):
                 username = user_identifier[1:]  # Remove @ symbol
+                username_lower = username.lower()
                 # Try to find user by username in chat data
                 found = False
                 for user_id_str, stats in chat_data["player_stats"].items():
-                    if stats.get("username", "").lower() == username.lower():
+                    if (stats.get("username") or "").lower() == username_lower:
                         try:
                             target_user = await context.bot.get_chat_member(chat_id, int(user_id_str))
                             target_user = target_user.user
@@ -613,7 +614,7 @@ async def admin_wallets(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
                 )
         
         if truncated:
-            remaining_count = len([aid for aid in current_admins if str(aid) in admin_data]) - max_entries
+            remaining_count = sum(1 for aid in current_admins if str(aid) in admin_data) - max_entries
             message += f"\n<i>... and {remaining_count} more admin(s)</i>"
         
         if admin_count == 0:
@@ -1,5 +1,6 @@
 import re
 import random
+import logging
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Union, Any
@@ -172,9 +173,12 @@ async def place_multiple_bets(update: Update, context: ContextTypes.DEFAULT_TYPE
         first_bet_type, first_amount, first_result = successful_bets[0]
         
         # Send single combined confirmation using the old format
-        # Create updated global_data with current chat_data for accurate wallet display
-        updated_global_data = global_data.copy()
-        updated_global_data["chat_data"] = chat_data
+        # Pass only the views format_bet_confirmation reads (global user data plus the
+        # current chat_data) instead of copying the whole global_data dict
+        updated_global_data = {
+            "global_user_data": global_data.get("global_user_data", {}),
+            "chat_data": chat_data,
+        }
         
         confirmation_message = await format_bet_confirmation(
             bet_type=first_bet_type,
@@ -532,8 +536,10 @@ async def auto_roll_dice(update, context) -> None:
     # Get current time
     now = datetime.now()
     
-    # Debug: Log all chats
-    logger.info(f"Processing {len(global_data['all_chat_data'])} chats: {list(global_data['all_chat_data'].keys())}")
+    # Debug: Log all chats (only build the chat id list when debug logging is on,
+    # this job runs every few seconds)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Processing {len(global_data['all_chat_data'])} chats: {list(global_data['all_chat_data'])}")
     
     # Iterate through all chats with active games
     for chat_id_str, chat_data in global_data["all_chat_data"].items():
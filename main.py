@@ -17,13 +17,13 @@ from config.config_manager import get_config
 from utils.logging_utils import setup_logging, get_logger
 
 # Import from reorganized modules
-from config.constants import global_data, ALLOWED_GROUP_IDS
+from config.constants import global_data, new_chat_data, ALLOWED_GROUP_IDS
 from config.settings import BOT_TOKEN, TIMEZONE, SUPER_ADMINS
 
 
 # Import error handler
 from utils.error_handler import error_handler, handle_error
-from utils.scheduler import start_scheduler, stop_scheduler
+from utils.scheduler import start_scheduler, stop_scheduler, shutdown_notification_bot
 
 # Import handlers from old module for backward compatibility
 import handlers
@@ -240,13 +240,7 @@ def load_data_unified() -> Dict:
                     
                     # Initialize chat data structure
                     if chat_id_str not in global_data["all_chat_data"]:
-                        global_data["all_chat_data"][chat_id_str] = {
-                            "player_stats": {},
-                            "match_counter": 1,
-                            "match_history": [],
-                            "group_admins": [],
-                            "consecutive_idle_matches": 0,
-                        }
+                        global_data["all_chat_data"][chat_id_str] = new_chat_data()
                     
                     # Load match counter
                     match_counter = db_adapter.get_chat_match_counter(chat_id)
@@ -273,13 +267,7 @@ def load_data_unified() -> Dict:
                     # Fallback to default empty structures
                     chat_id_str = str(chat_id)
                     if chat_id_str not in global_data["all_chat_data"]:
-                        global_data["all_chat_data"][chat_id_str] = {
-                            "player_stats": {},
-                            "match_counter": 1,
-                            "match_history": [],
-                            "group_admins": [],
-                            "consecutive_idle_matches": 0,
-                        }
+                        global_data["all_chat_data"][chat_id_str] = new_chat_data()
             
             # Load global user data from database
             logger.info("Loading global user data from database...")
@@ -484,6 +472,12 @@ def main() -> None:
     
     application.post_init = post_init_callback
     
+    # Close the scheduler's notification bot while the event loop is still running
+    async def post_shutdown_callback(app):
+        await shutdown_notification_bot()
+    
+    application.post_shutdown = post_shutdown_callback
+    
     # Start the bot with performance optimizations
     logger.info("Dice Game Bot started polling...")
     try:
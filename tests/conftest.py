@@ -0,0 +1,16 @@
+import pytest
+from unittest.mock import MagicMock
+from database.adapter import db_adapter as shared_db_adapter
+
+@pytest.fixture(scope="session")
+def db_adapter():
+    # Reuse the adapter the bot itself uses instead of building a second one
+    return shared_db_adapter
+
+@pytest.fixture
+def mock_update():
+    return MagicMock()
+
+@pytest.fixture
+def mock_context():
+    return MagicMock()
@@ -1,24 +1,10 @@
-import pytest
-from unittest.mock import patch, MagicMock
-from database.adapter import DatabaseAdapter
+from unittest.mock import patch
 from handlers.admin_handlers import adjust_score, check_user_score
 from handlers.superadmin_handlers import refresh_admins, admin_wallets
 from handlers.bet_handlers import place_bet
 from handlers.user_handlers import start_command
 from config.constants import SUPER_ADMINS
 
-@pytest.fixture
-def db_adapter():
-    return DatabaseAdapter()
-
-@pytest.fixture
-def mock_update():
-    return MagicMock()
-
-@pytest.fixture
-def mock_context():
-    return MagicMock()
-
 def test_user_registration(db_adapter, mock_update, mock_context):
     # Test user start command and registration
     mock_update.effective_user.id = 12345
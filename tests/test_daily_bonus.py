@@ -0,0 +1,95 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import pytz
+
+from config.settings import TIMEZONE
+from utils.daily_bonus import calculate_topup_from_history, process_daily_cashback
+
+
+def make_chat_data(target_date):
+    day = datetime.combine(target_date, datetime.min.time())
+    return {
+        "player_stats": {
+            "1": {"username": "loser", "score": 200},
+            "2": {"username": "winner", "score": 900},
+            "3": {"username": "idle", "score": 500},
+            "4": {"username": "broke", "score": 0},
+        },
+        "match_history": [
+            {"timestamp": (day + timedelta(hours=1)).isoformat(),
+             "losers": [{"user_id": "1", "bet_amount": 300}, {"user_id": "4", "bet_amount": 100}],
+             "winners": [{"user_id": "2", "payout": 400}]},
+            {"timestamp": day + timedelta(hours=5),
+             "losers": [{"user_id": "1", "bet_amount": 500}, {"user_id": "2", "bet_amount": 50}],
+             "winners": [{"user_id": "4", "payout": 150}]},
+            # A match from another day must not count
+            {"timestamp": (day - timedelta(days=1)).isoformat(),
+             "losers": [{"user_id": "3", "bet_amount": 1000}],
+             "winners": []},
+        ],
+    }
+
+
+EXPECTED_TOPUPS = {
+    "1": {"total_topup": 1000, "remaining_at_midnight": 200, "estimated": True,
+          "total_bets": 800, "total_winnings": 0},
+    "2": {"total_topup": 550, "remaining_at_midnight": 900, "estimated": True,
+          "total_bets": 50, "total_winnings": 400},
+    # Won more than they bet with nothing left: estimated topup is not positive
+    "4": None,
+    # Only played on another day
+    "3": None,
+    # Not a player in the chat
+    "5": None,
+}
+
+
+def test_topup_from_history():
+    target_date = datetime(2025, 6, 1).date()
+    chat_data = make_chat_data(target_date)
+    history_cache = {}
+    for user_id, expected in EXPECTED_TOPUPS.items():
+        assert calculate_topup_from_history(user_id, "-100", target_date, chat_data, history_cache) == expected
+        assert calculate_topup_from_history(user_id, "-100", target_date, chat_data) == expected
+
+
+def test_topup_from_history_no_matches_on_date():
+    chat_data = make_chat_data(datetime(2025, 6, 1).date())
+    other_date = datetime(2025, 7, 1).date()
+    history_cache = {}
+    for user_id in chat_data["player_stats"]:
+        assert calculate_topup_from_history(user_id, "-100", other_date, chat_data, history_cache) is None
+
+
+def test_topup_from_history_bad_timestamp_logged_once_per_chat(caplog):
+    target_date = datetime(2025, 6, 1).date()
+    chat_data = make_chat_data(target_date)
+    chat_data["match_history"].append({"timestamp": None, "losers": [], "winners": []})
+    history_cache = {}
+    with caplog.at_level(logging.ERROR, logger="utils.daily_bonus"):
+        for user_id in chat_data["player_stats"]:
+            assert calculate_topup_from_history(user_id, "-100", target_date, chat_data, history_cache) is None
+    assert len([r for r in caplog.records if "Error calculating topup" in r.getMessage()]) == 1
+
+
+def test_daily_cashback_amounts():
+    yesterday = datetime.now(pytz.timezone(TIMEZONE)).date() - timedelta(days=1)
+    data = {"all_chat_data": {"-100": make_chat_data(yesterday)}, "global_user_data": {}}
+
+    context = MagicMock()
+    context.bot.send_message = AsyncMock()
+    with patch("utils.daily_bonus.global_data", data), \
+         patch("utils.daily_bonus.USE_DATABASE", False), \
+         patch("utils.daily_bonus.DAILY_CASHBACK_PERCENTAGE", 0.05), \
+         patch("utils.daily_bonus.save_data_unified"), \
+         patch("utils.daily_bonus.send_daily_cashback_notification_to_super_admins", AsyncMock()) as mock_report:
+        asyncio.run(process_daily_cashback(context))
+
+    # User 1 lost 800 (topup 1000, 200 left): 5% is 40. User 2 ended up ahead.
+    awarded = {user_id: user["bonus_points"] for user_id, user in data["global_user_data"].items()}
+    assert awarded == {"1": 40}
+    assert data["daily_losses"]["1"][str(yesterday)]["daily_loss"] == 800
+    mock_report.assert_awaited_once_with(1, 40, context)
@@ -1,15 +1,20 @@
 import unittest
 import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from database.queries import get_daily_house_stats
-from utils.scheduler import send_refill_notification_to_super_admins
+from utils.scheduler import send_refill_notification_to_super_admins, get_notification_bot, shutdown_notification_bot, reset_notification_bot
 
 class TestDailyReport(unittest.TestCase):
 
     def setUp(self):
         self.start = datetime.now() - timedelta(days=1)
         self.end = datetime.now()
+        # Don't let a notification bot cached by another test leak into this one
+        reset_notification_bot()
+
+    def tearDown(self):
+        reset_notification_bot()
 
     @patch('database.queries.get_db_session')
     def test_get_daily_house_stats(self, mock_session):
@@ -26,11 +31,79 @@ class TestDailyReport(unittest.TestCase):
     @patch('telegram.Bot')
     @patch('utils.user_utils.get_user_display_name')
     def test_send_refill_notification(self, mock_display, mock_bot, mock_session):
+        mock_bot.return_value = AsyncMock()
         mock_display.return_value = 'TestAdmin'
         mock_session.return_value.__enter__.return_value.query.return_value.join.return_value.filter.return_value.scalar.side_effect = [10000, 8000]
         refill_details = [{'admin_id': '1', 'username': 'admin', 'refills': [{'chat_id': '1', 'old_amount': 0, 'new_amount': 1000}]}]
-        asyncio.run(send_refill_notification_to_super_admins(refill_details, 1))
+
+        async def run():
+            try:
+                await send_refill_notification_to_super_admins(refill_details, 1)
+            finally:
+                await shutdown_notification_bot()
+
+        asyncio.run(run())
         mock_bot.return_value.send_message.assert_called()
+        mock_bot.return_value.shutdown.assert_awaited()
+
+    @patch('database.queries.get_db_session')
+    @patch('config.constants.SUPER_ADMINS', [123])
+    @patch('telegram.Bot')
+    @patch('utils.user_utils.get_user_display_name')
+    def test_refill_notification_resent_as_plain_text(self, mock_display, mock_bot, mock_session):
+        from telegram.error import BadRequest
+
+        mock_bot.return_value = AsyncMock()
+        mock_bot.return_value.send_message.side_effect = [BadRequest("Can't parse entities: unclosed tag"), None]
+        mock_display.side_effect = Exception("no display name")
+        mock_session.return_value.__enter__.return_value.query.return_value.join.return_value.filter.return_value.scalar.side_effect = [10000, 8000]
+        refill_details = [{'admin_id': '1', 'username': 'Tom & Jerry', 'refills': [{'chat_id': '1', 'old_amount': 0, 'new_amount': 1000}]}]
+
+        async def run():
+            try:
+                await send_refill_notification_to_super_admins(refill_details, 1)
+            finally:
+                await shutdown_notification_bot()
+
+        asyncio.run(run())
+        html_call, plain_call = mock_bot.return_value.send_message.await_args_list
+        self.assertEqual(html_call.kwargs['parse_mode'], 'HTML')
+        self.assertNotIn('parse_mode', plain_call.kwargs)
+        plain_text = plain_call.kwargs['text']
+        self.assertIn('Daily Report', plain_text)
+        self.assertIn('Tom & Jerry', plain_text)
+        self.assertNotIn('<b>', plain_text)
+        self.assertNotIn('&amp;', plain_text)
+
+    @patch('config.constants.SUPER_ADMINS', [123])
+    @patch('telegram.Bot')
+    def test_notification_bot_cached_per_event_loop(self, mock_bot):
+        mock_bot.side_effect = lambda *args, **kwargs: AsyncMock()
+
+        async def get_twice():
+            return await get_notification_bot(), await get_notification_bot()
+
+        first, again = asyncio.run(get_twice())
+        second, _ = asyncio.run(get_twice())
+        self.assertIs(first, again)
+        self.assertIsNot(first, second)
+
+    @patch('telegram.Bot')
+    def test_notification_bot_rebuilt_when_super_admins_change(self, mock_bot):
+        mock_bot.side_effect = lambda *args, **kwargs: AsyncMock()
+
+        async def run():
+            with patch('config.constants.SUPER_ADMINS', [123]):
+                small = await get_notification_bot()
+            with patch('config.constants.SUPER_ADMINS', [123, 456, 789]):
+                large = await get_notification_bot()
+            await shutdown_notification_bot()
+            return small, large
+
+        small, large = asyncio.run(run())
+        self.assertIsNot(small, large)
+        small.shutdown.assert_awaited()
+        large.shutdown.assert_awaited()
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,10 +1,3 @@
-import pytest
-from database.adapter import DatabaseAdapter
-
-@pytest.fixture
-def db_adapter():
-    return DatabaseAdapter()
-
 def test_get_user_referral_points(db_adapter):
     # Assuming a test user ID that exists or mock if needed
     points = db_adapter.get_user_referral_points(12345)
@@ -0,0 +1,18 @@
+import json
+import logging
+from utils.logging_utils import setup_logging
+
+def test_json_file_log_keeps_exception(tmp_path):
+    log_file = tmp_path / "bot.log"
+    setup_logging("INFO", log_file=str(log_file))
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logging.getLogger("test").error("failed %s", "here", exc_info=True)
+    # Reconfiguring stops the listener, flushing queued records to the file
+    setup_logging("INFO")
+
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+    record = next(r for r in records if r["logger"] == "test")
+    assert record["message"] == "failed here"
+    assert "ValueError: boom" in record["exception"]
@@ -0,0 +1,28 @@
+from utils.telegram_utils import split_message, html_to_plain_text
+
+def test_split_message_under_limit():
+    text = "line one\nline two\n"
+    assert split_message(text, max_length=100) == [text]
+
+def test_split_message_cuts_on_line_boundaries():
+    text = "aaaa\nbbbb\ncccc\n"
+    chunks = split_message(text, max_length=10)
+    assert chunks == ["aaaa\nbbbb\n", "cccc\n"]
+    assert all(len(chunk) <= 10 for chunk in chunks)
+    assert "".join(chunks) == text
+
+def test_split_message_hard_cuts_oversize_line():
+    text = "short\n" + "x" * 25 + "\nend"
+    chunks = split_message(text, max_length=10)
+    assert chunks == ["short\n", "x" * 10, "x" * 10, "x" * 5 + "\nend"]
+    assert all(len(chunk) <= 10 for chunk in chunks)
+    assert "".join(chunks) == text
+
+def test_html_to_plain_text_strips_tags_and_entities():
+    text = "🏠 <b>Tom &amp; Jerry &lt;3</b>\n<i>done</i>"
+    assert html_to_plain_text(text) == "🏠 Tom & Jerry <3\ndone"
+
+def test_html_to_plain_text_strips_tags_cut_at_chunk_edges():
+    chunks = split_message("<b>" + "y" * 10 + "</b>", max_length=8)
+    assert chunks == ["<b>yyyyy", "yyyyy</b", ">"]
+    assert [html_to_plain_text(chunk) for chunk in chunks] == ["yyyyy", "yyyyy", ""]
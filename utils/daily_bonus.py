@@ -1,6 +1,7 @@
+import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Optional, List
 import pytz
 from config.settings import USE_DATABASE, TIMEZONE
 from database.adapter import db_adapter
@@ -27,18 +28,17 @@ async def process_daily_cashback(context):
     now = datetime.now(tz)
     today = now.date()
     yesterday = today - timedelta(days=1)
+    today_str = str(today)
+    yesterday_str = str(yesterday)
     
     # Calculate midnight time for yesterday in Myanmar timezone
     yesterday_midnight = tz.localize(datetime.combine(yesterday, datetime.min.time()))
     today_midnight = tz.localize(datetime.combine(today, datetime.min.time()))
     
     # Initialize tracking structures if not exists
-    if "daily_losses" not in global_data:
-        global_data["daily_losses"] = {}
-    if "user_topups" not in global_data:
-        global_data["user_topups"] = {}
-    if "global_user_data" not in global_data:
-        global_data["global_user_data"] = {}
+    daily_losses = global_data.setdefault("daily_losses", {})
+    all_user_topups = global_data.setdefault("user_topups", {})
+    global_user_data = global_data.setdefault("global_user_data", {})
     
     total_cashback_users = 0
     total_cashback_amount = 0
@@ -48,27 +48,28 @@ async def process_daily_cashback(context):
         if "player_stats" not in chat_data:
             continue
         
+        # Yesterday's per-user match totals, built at most once per chat
+        history_cache = {}
+        
         # Process each user in the chat
         for user_id, player_stats in chat_data["player_stats"].items():
             try:
                 # Get user's topup data for yesterday
-                user_topups = global_data["user_topups"].get(user_id, {})
-                yesterday_topup_data = user_topups.get(str(yesterday), {})
+                user_topups = all_user_topups.get(user_id, {})
+                yesterday_topup_data = user_topups.get(yesterday_str, {})
                 
                 if not yesterday_topup_data:
                     # If no topup data exists, try to calculate from match history
                     yesterday_topup_data = calculate_topup_from_history(
-                        user_id, chat_id_str, yesterday, chat_data
+                        user_id, chat_id_str, yesterday, chat_data, history_cache
                     )
                     
                     if yesterday_topup_data:
                         # Store calculated topup data
-                        if user_id not in global_data["user_topups"]:
-                            global_data["user_topups"][user_id] = {}
-                        global_data["user_topups"][user_id][str(yesterday)] = yesterday_topup_data
+                        all_user_topups.setdefault(user_id, {})[yesterday_str] = yesterday_topup_data
                 
                 if not yesterday_topup_data:
-                    logger.debug(f"No topup data found for user {user_id} on {yesterday}")
+                    logger.debug("No topup data found for user %s on %s", user_id, yesterday)
                     continue
                 
                 total_topup = yesterday_topup_data.get("total_topup", 0)
@@ -78,7 +79,7 @@ async def process_daily_cashback(context):
                 daily_loss = total_topup - remaining_at_midnight
                 
                 if daily_loss <= 0:
-                    logger.debug(f"User {user_id} had no loss on {yesterday} (topup: {total_topup}, remaining: {remaining_at_midnight})")
+                    logger.debug("User %s had no loss on %s (topup: %s, remaining: %s)", user_id, yesterday, total_topup, remaining_at_midnight)
                     continue
                 
                 # Calculate 5% cashback
@@ -88,36 +89,30 @@ async def process_daily_cashback(context):
                     continue
                 
                 # Initialize global user data if not exists
-                if user_id not in global_data["global_user_data"]:
-                    global_data["global_user_data"][user_id] = {
-                        "referral_points": 0,
-                        "bonus_points": 0,
-                        "last_cashback_date": None
-                    }
+                user_data = global_user_data.setdefault(user_id, {
+                    "referral_points": 0,
+                    "bonus_points": 0,
+                    "last_cashback_date": None
+                })
                 
                 # Check if user already received cashback today
-                last_cashback_date = global_data["global_user_data"][user_id].get("last_cashback_date")
-                if last_cashback_date == str(today):
+                if user_data.get("last_cashback_date") == today_str:
                     logger.info(f"User {user_id} already received cashback today ({today}), skipping")
                     continue
                 
                 # Add cashback to bonus points
-                global_data["global_user_data"][user_id]["bonus_points"] += cashback
-                global_data["global_user_data"][user_id]["last_cashback_date"] = str(today)
+                user_data["bonus_points"] += cashback
+                user_data["last_cashback_date"] = today_str
                 
                 # Sync with database if enabled
                 if USE_DATABASE:
                     try:
-                        db_adapter.update_user_bonus_points(int(user_id), 
-                            global_data["global_user_data"][user_id]["bonus_points"])
+                        db_adapter.update_user_bonus_points(int(user_id), user_data["bonus_points"])
                     except Exception as e:
                         logger.error(f"Failed to sync bonus points to database for user {user_id}: {e}")
                 
                 # Record the cashback in daily_losses
-                if user_id not in global_data["daily_losses"]:
-                    global_data["daily_losses"][user_id] = {}
-                
-                global_data["daily_losses"][user_id][str(yesterday)] = {
+                daily_losses.setdefault(user_id, {})[yesterday_str] = {
                     "total_topup": total_topup,
                     "remaining_at_midnight": remaining_at_midnight,
                     "daily_loss": daily_loss,
@@ -168,10 +163,39 @@ async def process_daily_cashback(context):
     await send_daily_cashback_notification_to_super_admins(total_cashback_users, total_cashback_amount, context)
 
 
-def calculate_topup_from_history(user_id: str, chat_id: str, target_date: datetime.date, chat_data: Dict[str, Any]) -> Dict[str, Any]:
+def summarize_match_history(chat_data: Dict[str, Any], target_date: datetime.date) -> Optional[Dict[Any, List[int]]]:
+    """
+    Total each user's lost bets and winning payouts over the matches played on target_date.
+    Returns {user_id: [total_bets, total_winnings]}, or None if no match was played that day.
+    Walks the chat's match history once so cashback does not rescan it for every player.
+    """
+    totals = None
+    for match in chat_data.get("match_history", []):
+        match_timestamp = match.get("timestamp")
+        if isinstance(match_timestamp, str):
+            match_timestamp = datetime.fromisoformat(match_timestamp)
+        
+        if match_timestamp.date() != target_date:
+            continue
+        
+        if totals is None:
+            totals = {}
+        
+        # Losers contribute their bet amount, winners their payout
+        for loser in match.get("losers", []):
+            totals.setdefault(loser.get("user_id"), [0, 0])[0] += loser.get("bet_amount", 0)
+        for winner in match.get("winners", []):
+            totals.setdefault(winner.get("user_id"), [0, 0])[1] += winner.get("payout", 0)
+    
+    return totals
+
+
+def calculate_topup_from_history(user_id: str, chat_id: str, target_date: datetime.date, chat_data: Dict[str, Any],
+                                 history_cache: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Calculate user's topup and remaining amount from match history if direct topup data is not available.
     This is a fallback method to estimate topup data from game activity.
+    Pass the same history_cache dict for every player of a chat so its match history is summarized only once.
     """
     try:
         match_history = chat_data.get("match_history", [])
@@ -180,35 +204,28 @@ def calculate_topup_from_history(user_id: str, chat_id: str, target_date: dateti
         if not match_history or not player_stats:
             return None
         
-        # Get matches from the target date
-        target_matches = []
-        for match in match_history:
-            match_timestamp = match.get("timestamp")
-            if isinstance(match_timestamp, str):
-                match_timestamp = datetime.fromisoformat(match_timestamp)
-            
-            if match_timestamp.date() == target_date:
-                target_matches.append(match)
+        if history_cache is not None and "match_totals" in history_cache:
+            match_totals = history_cache["match_totals"]
+        else:
+            try:
+                match_totals = summarize_match_history(chat_data, target_date)
+            except Exception as e:
+                # Unreadable history gives no estimate for anyone in the chat; report it once
+                logger.error(f"Error calculating topup from history for chat {chat_id}: {e}")
+                match_totals = None
+            if history_cache is not None:
+                history_cache["match_totals"] = match_totals
         
-        if not target_matches:
+        # No matches were played on the target date
+        if match_totals is None:
             return None
         
-        # Calculate total bets (losses) for the day
-        total_bets = 0
-        total_winnings = 0
+        # The user played no match on the target date, so there is nothing to estimate from
+        if user_id not in match_totals:
+            return None
         
-        for match in target_matches:
-            # Check if user was a loser
-            losers = match.get("losers", [])
-            for loser in losers:
-                if loser.get("user_id") == user_id:
-                    total_bets += loser.get("bet_amount", 0)
-            
-            # Check if user was a winner
-            winners = match.get("winners", [])
-            for winner in winners:
-                if winner.get("user_id") == user_id:
-                    total_winnings += winner.get("payout", 0)
+        # Total bets (losses) and winnings for the day
+        total_bets, total_winnings = match_totals[user_id]
         
         # Estimate topup as current score + total bets - total winnings
         # This is an approximation and may not be 100% accurate
@@ -240,6 +257,10 @@ async def send_daily_cashback_notification_to_super_admins(total_users, total_am
         from config.constants import SUPER_ADMINS
         from utils.formatting import escape_markdown
         
+        if not SUPER_ADMINS:
+            logger.info("No super admins configured, skipping daily cashback report")
+            return
+        
         if total_users == 0:
             message = (
                 f"🎁 <b>Daily Cashback Report</b>\n\n"
@@ -260,17 +281,17 @@ async def send_daily_cashback_notification_to_super_admins(total_users, total_am
                 f"✅ All eligible users have been notified via private message."
             )
         
-        # Send to each super admin
-        for super_admin_id in SUPER_ADMINS:
-            try:
-                await context.bot.send_message(
-                    chat_id=super_admin_id,
-                    text=message,
-                    parse_mode="HTML"
-                )
+        # Send to all super admins concurrently
+        results = await asyncio.gather(
+            *(context.bot.send_message(chat_id=super_admin_id, text=message, parse_mode="HTML")
+              for super_admin_id in SUPER_ADMINS),
+            return_exceptions=True
+        )
+        for super_admin_id, result in zip(SUPER_ADMINS, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Failed to notify super admin {super_admin_id} about daily cashback: {result}")
+            else:
                 logger.info(f"✅ Successfully sent daily cashback report to super admin {super_admin_id}")
-            except Exception as e:
-                logger.error(f"❌ Failed to notify super admin {super_admin_id} about daily cashback: {e}")
                 
     except Exception as e:
         logger.error(f"Error sending daily cashback notification to super admins: {e}")
@@ -285,23 +306,16 @@ async def track_user_topup(user_id: str, amount: int, context=None):
         tz = pytz.timezone(TIMEZONE)
         today = datetime.now(tz).date()
         
-        if "user_topups" not in global_data:
-            global_data["user_topups"] = {}
-        
-        if user_id not in global_data["user_topups"]:
-            global_data["user_topups"][user_id] = {}
-        
-        today_str = str(today)
-        if today_str not in global_data["user_topups"][user_id]:
-            global_data["user_topups"][user_id][today_str] = {
-                "total_topup": 0,
-                "remaining_at_midnight": 0,
-                "topup_history": []
-            }
+        user_topups = global_data.setdefault("user_topups", {}).setdefault(user_id, {})
+        today_topup = user_topups.setdefault(str(today), {
+            "total_topup": 0,
+            "remaining_at_midnight": 0,
+            "topup_history": []
+        })
         
         # Add to total topup
-        global_data["user_topups"][user_id][today_str]["total_topup"] += amount
-        global_data["user_topups"][user_id][today_str]["topup_history"].append({
+        today_topup["total_topup"] += amount
+        today_topup["topup_history"].append({
             "amount": amount,
             "timestamp": datetime.now(tz).isoformat()
         })
@@ -324,21 +338,13 @@ async def update_user_midnight_balance(user_id: str, chat_id: str, balance: int)
         tz = pytz.timezone(TIMEZONE)
         today = datetime.now(tz).date()
         
-        if "user_topups" not in global_data:
-            global_data["user_topups"] = {}
-        
-        if user_id not in global_data["user_topups"]:
-            global_data["user_topups"][user_id] = {}
-        
-        today_str = str(today)
-        if today_str not in global_data["user_topups"][user_id]:
-            global_data["user_topups"][user_id][today_str] = {
-                "total_topup": 0,
-                "remaining_at_midnight": balance,
-                "topup_history": []
-            }
-        else:
-            global_data["user_topups"][user_id][today_str]["remaining_at_midnight"] = balance
+        user_topups = global_data.setdefault("user_topups", {}).setdefault(user_id, {})
+        today_topup = user_topups.setdefault(str(today), {
+            "total_topup": 0,
+            "remaining_at_midnight": balance,
+            "topup_history": []
+        })
+        today_topup["remaining_at_midnight"] = balance
         
         logger.debug(f"💳 Updated midnight balance for user {user_id}: {balance:,} ကျပ်")
         
@@ -1,7 +1,9 @@
+import atexit
 import logging
 import logging.handlers
 import json
 import os
+import queue
 import sys
 from datetime import datetime
 from typing import Dict, Any, Optional
@@ -9,6 +11,9 @@ from typing import Dict, Any, Optional
 # Configure the root logger
 root_logger = logging.getLogger()
 
+# Background listener that writes queued records to the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 # Define log levels
 LOG_LEVELS = {
     "DEBUG": logging.DEBUG,
@@ -57,22 +62,45 @@ class StandardFormatter(logging.Formatter):
         "RESET": "\033[0m"       # Reset
     }
     
-    def format(self, record):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.use_color = sys.stdout.isatty()  # Check if output is to a terminal
+        # One formatter per level name, built on first use
+        self._formatters: Dict[str, logging.Formatter] = {}
+    
+    def _build_formatter(self, levelname: str) -> logging.Formatter:
         log_format = "%(asctime)s - %(name)s - "
         
         # Add color to the level name if supported
-        if sys.stdout.isatty():  # Check if output is to a terminal
-            level_color = self.COLORS.get(record.levelname, self.COLORS["RESET"])
+        if self.use_color:
+            level_color = self.COLORS.get(levelname, self.COLORS["RESET"])
             log_format += f"{level_color}%(levelname)s{self.COLORS['RESET']} - "
         else:
             log_format += "%(levelname)s - "
             
         log_format += "%(message)s"
         
-        formatter = logging.Formatter(log_format, datefmt="%Y-%m-%d %H:%M:%S")
+        return logging.Formatter(log_format, datefmt="%Y-%m-%d %H:%M:%S")
+    
+    def format(self, record):
+        formatter = self._formatters.get(record.levelname)
+        if formatter is None:
+            formatter = self._formatters[record.levelname] = self._build_formatter(record.levelname)
         return formatter.format(record)
 
 
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler for a listener in the same process.
+    
+    The stock prepare() formats the record and clears exc_info so it can be
+    pickled; here the record is queued as-is so downstream formatters (like
+    JsonFormatter's "exception" field) still see exc_info and args.
+    """
+    
+    def prepare(self, record):
+        return record
+
+
 def setup_logging(log_level: str = "INFO", 
                  log_file: Optional[str] = None,
                  json_format: bool = False,
@@ -87,6 +115,8 @@ def setup_logging(log_level: str = "INFO",
         max_file_size_mb: Maximum size of log file in MB before rotation
         backup_count: Number of backup log files to keep
     """
+    global _queue_listener
+    
     # Get the numeric log level
     numeric_level = LOG_LEVELS.get(log_level.upper(), logging.INFO)
     
@@ -97,6 +127,13 @@ def setup_logging(log_level: str = "INFO",
     for handler in root_logger.handlers[:]:  
         root_logger.removeHandler(handler)
     
+    # Stop the listener from a previous setup so its handlers are flushed and closed
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    
+    handlers = []
+    
     # Create console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(numeric_level)
@@ -108,7 +145,7 @@ def setup_logging(log_level: str = "INFO",
         console_formatter = StandardFormatter()
         
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
     
     # Add rotating file handler if log_file is specified
     if log_file:
@@ -129,7 +166,14 @@ def setup_logging(log_level: str = "INFO",
         # Always use JSON format for file logging for better parsing
         file_formatter = JsonFormatter()
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Callers only enqueue records; console and file writes happen on the
+    # listener's thread so they never block the event loop
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(LocalQueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
     
     # Log the configuration
     if log_file:
@@ -138,6 +182,15 @@ def setup_logging(log_level: str = "INFO",
         logging.info(f"Logging configured with level={log_level}, console_only=True, json_format={json_format}")
 
 
+def _stop_queue_listener() -> None:
+    """Flush pending log records on interpreter exit"""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name"""
     return logging.getLogger(name)
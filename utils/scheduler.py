@@ -20,6 +20,64 @@ logger = logging.getLogger(__name__)
 # Global scheduler instance
 scheduler: Optional[AsyncIOScheduler] = None
 
+# Bot used for scheduled notifications, cached per event loop and pool size.
+# Its HTTP connections belong to the loop that opened them, so a new loop
+# (e.g. a separate asyncio.run) gets a fresh Bot.
+_notification_bot = None
+_notification_bot_key = None
+
+
+async def get_notification_bot():
+    """
+    Get the shared Bot used for scheduled notifications, creating it on first use.
+    Reusing one instance keeps its HTTP connection pool alive between daily runs
+    on the same event loop.
+    """
+    global _notification_bot, _notification_bot_key
+    
+    from config.constants import SUPER_ADMINS
+    
+    # One connection per super admin so the concurrent report sends don't queue for the pool
+    pool_size = len(SUPER_ADMINS) + 1
+    key = (asyncio.get_running_loop(), pool_size)
+    
+    if _notification_bot is None or _notification_bot_key != key:
+        await shutdown_notification_bot()
+        
+        from telegram import Bot
+        from telegram.request import HTTPXRequest
+        from config.settings import BOT_TOKEN
+        request = HTTPXRequest(connection_pool_size=pool_size, pool_timeout=30)
+        bot = Bot(token=BOT_TOKEN, request=request)
+        await bot.initialize()
+        _notification_bot, _notification_bot_key = bot, key
+    return _notification_bot
+
+
+async def shutdown_notification_bot():
+    """
+    Close the cached notification Bot's connections and drop it from the cache.
+    A Bot created on another event loop is only dropped, since its loop can no longer run it.
+    """
+    bot, key = _notification_bot, _notification_bot_key
+    reset_notification_bot()
+    
+    if bot is not None and key[0] is asyncio.get_running_loop():
+        try:
+            await bot.shutdown()
+        except Exception as e:
+            logger.error(f"Error shutting down notification bot: {e}")
+
+
+def reset_notification_bot():
+    """
+    Drop the cached notification Bot without closing it, for when its event loop is gone.
+    """
+    global _notification_bot, _notification_bot_key
+    
+    _notification_bot = None
+    _notification_bot_key = None
+
 
 async def daily_admin_wallet_refill():
     """
@@ -93,13 +151,17 @@ async def send_refill_notification_to_super_admins(refill_details, total_refills
     """
     try:
         from config.constants import SUPER_ADMINS
-        from telegram import Bot
-        from config.settings import BOT_TOKEN
         from utils.formatting import escape_markdown, escape_markdown_username
         from utils.user_utils import get_user_display_name
+        from utils.telegram_utils import split_message, html_to_plain_text
+        from telegram.error import BadRequest
         from telegram.ext import ContextTypes
         
-        bot = Bot(token=BOT_TOKEN)
+        if not SUPER_ADMINS:
+            logger.info("No super admins configured, skipping refill notification")
+            return
+        
+        bot = await get_notification_bot()
         
         # Create a context for get_user_display_name
         class MockContext:
@@ -142,19 +204,19 @@ async def send_refill_notification_to_super_admins(refill_details, total_refills
         yesterday_formatted = yesterday_start.strftime("%Y-%m-%d")
         
         # Build message with proper HTML escaping (no backslashes)
-        message = "🔄 <b>Daily Report</b>\n\n"
-        message += "<b>📊 House Win/Loss Statistics ({}):</b>\n".format(yesterday_formatted)
-        message += "  💰 Total Bets: {:,} ကျပ်\n".format(house_stats['total_bets'])
-        message += "  💸 Total Payouts: {:,} ကျပ်\n".format(house_stats['total_payouts'])
-        message += "  📈 House Profit: {:,} ကျပ်\n".format(house_stats['house_profit'])
-        message += "  🎲 Total Matches: {:,}\n".format(house_stats['total_matches'])
-        message += "  👥 Unique Players: {:,}\n\n".format(house_stats['unique_players'])
-        
-        message += "<b>🔄 Admin Wallet Refills:</b>\n"
-        message += "  📦 Total Refills: {:,} wallets\n".format(total_refills)
-        message += "  💎 Refill Amount: {:,} points each\n\n".format(ADMIN_WALLET_AMOUNT)
-        
-        message += "<b>👥 Refilled Admins:</b>\n"
+        message_parts = [
+            "🔄 <b>Daily Report</b>\n\n",
+            "<b>📊 House Win/Loss Statistics ({}):</b>\n".format(yesterday_formatted),
+            "  💰 Total Bets: {:,} ကျပ်\n".format(house_stats['total_bets']),
+            "  💸 Total Payouts: {:,} ကျပ်\n".format(house_stats['total_payouts']),
+            "  📈 House Profit: {:,} ကျပ်\n".format(house_stats['house_profit']),
+            "  🎲 Total Matches: {:,}\n".format(house_stats['total_matches']),
+            "  👥 Unique Players: {:,}\n\n".format(house_stats['unique_players']),
+            "<b>🔄 Admin Wallet Refills:</b>\n",
+            "  📦 Total Refills: {:,} wallets\n".format(total_refills),
+            "  💎 Refill Amount: {:,} points each\n\n".format(ADMIN_WALLET_AMOUNT),
+            "<b>👥 Refilled Admins:</b>\n",
+        ]
         
         # Group refills by chat to show group names
         chat_refills = {}
@@ -182,7 +244,7 @@ async def send_refill_notification_to_super_admins(refill_details, total_refills
                 logger.error(f"Error getting group name for chat {chat_id}: {e}")
                 group_name = f"Group {chat_id}"
             
-            message += "\n🏠 <b>{}</b> (ID: {})\n".format(group_name, chat_id)
+            message_parts.append("\n🏠 <b>{}</b> (ID: {})\n".format(group_name, chat_id))
             
             for refill in refills:
                 admin_id = int(refill["admin_id"])
@@ -200,23 +262,38 @@ async def send_refill_notification_to_super_admins(refill_details, total_refills
                 
                 old_amount = refill["old_amount"]
                 new_amount = refill["new_amount"]
-                message += "  👤 {}: {:,} → {:,} points\n".format(display_name, old_amount, new_amount)
+                message_parts.append("  👤 {}: {:,} → {:,} points\n".format(display_name, old_amount, new_amount))
         
         # Add footer with timestamp
         current_time = now.strftime("%Y-%m-%d %H:%M:%S %Z")
-        message += "\n⏰ <i>Report generated at: {}</i>".format(current_time)
+        message_parts.append("\n⏰ <i>Report generated at: {}</i>".format(current_time))
+        message = "".join(message_parts)
         
-        # Send to all super admins
-        for super_admin_id in SUPER_ADMINS:
-            try:
-                await bot.send_message(
-                    chat_id=super_admin_id,
-                    text=message,
-                    parse_mode="HTML"
-                )
+        # Long reports (many groups/admins) are sent in parts to stay under Telegram's length limit
+        message_chunks = split_message(message)
+        
+        async def send_report(super_admin_id):
+            for chunk in message_chunks:
+                try:
+                    await bot.send_message(chat_id=super_admin_id, text=chunk, parse_mode="HTML")
+                except BadRequest as e:
+                    if "can't parse entities" not in str(e).lower():
+                        raise
+                    # An overlong line cut at the length limit can split an HTML tag
+                    plain_chunk = html_to_plain_text(chunk)
+                    if plain_chunk.strip():
+                        await bot.send_message(chat_id=super_admin_id, text=plain_chunk)
+        
+        # Send to all super admins concurrently
+        results = await asyncio.gather(
+            *(send_report(super_admin_id) for super_admin_id in SUPER_ADMINS),
+            return_exceptions=True
+        )
+        for super_admin_id, result in zip(SUPER_ADMINS, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send refill notification to super admin {super_admin_id}: {result}")
+            else:
                 logger.info(f"Sent refill notification to super admin {super_admin_id}")
-            except Exception as e:
-                logger.error(f"Failed to send refill notification to super admin {super_admin_id}: {e}")
                 
     except Exception as e:
         logger.error(f"Error sending refill notifications: {e}")
@@ -307,6 +384,8 @@ def stop_scheduler():
         try:
             scheduler.shutdown(wait=False)
             scheduler = None
+            # The bot's event loop is shutting down with the scheduler
+            reset_notification_bot()
             logger.info("Scheduler stopped")
         except Exception as e:
             # Ignore event loop closed errors during shutdown
@@ -349,7 +428,11 @@ async def manual_admin_wallet_refill():
     Manual trigger for admin wallet refill (for testing purposes).
     """
     logger.info("Manual admin wallet refill triggered")
-    await daily_admin_wallet_refill()
+    try:
+        await daily_admin_wallet_refill()
+    finally:
+        # Manual runs usually get their own event loop, so don't leave its connections open
+        await shutdown_notification_bot()
 
 
 async def manual_daily_cashback(context=None):
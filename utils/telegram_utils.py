@@ -1,3 +1,5 @@
+import re
+import html
 import asyncio
 import logging
 import telegram
@@ -15,6 +17,13 @@ from utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# HTML tags, plus tag fragments left at the edges of a chunk cut mid-tag
+HTML_TAG_PATTERN = re.compile(r"<[^<>]*>|^[^<>]*>|<[^<>]*$")
+
+# Telegram errors that are expected when fetching admins (matched in a single scan)
+EXPECTED_ADMIN_FETCH_ERRORS = re.compile(
+    r"Chat not found|Group migrated to supergroup|There are no administrators in the private chat"
+)
 
 
 async def is_admin(chat_id: int, user_id: int, context: ContextTypes.DEFAULT_TYPE) -> bool:
@@ -80,7 +89,7 @@ async def get_admins_from_chat(chat_id: int, context: ContextTypes.DEFAULT_TYPE)
     except telegram.error.TelegramError as e:
         error_msg = str(e)
         # Only log as error for unexpected issues, not for common expected cases
-        if any(expected in error_msg for expected in ["Chat not found", "Group migrated to supergroup", "There are no administrators in the private chat"]):
+        if EXPECTED_ADMIN_FETCH_ERRORS.search(error_msg):
             logger.debug(f"Expected Telegram API response for {chat_id}: {e}")
         else:
             logger.error(f"Error fetching chat administrators for {chat_id}: {e}")
@@ -267,6 +276,61 @@ def create_inline_keyboard(buttons: List[List[Tuple[str, str]]]) -> InlineKeyboa
     return InlineKeyboardMarkup(keyboard)
 
 
+def split_message(text: str, max_length: int = 4096) -> List[str]:
+    """
+    Splits text into chunks that fit in a single Telegram message.
+    
+    Chunks are cut on line boundaries so per-line HTML tags stay balanced.
+    A single line longer than max_length is cut at max_length, which can land
+    inside an HTML tag or entity; callers sending with parse_mode="HTML" should
+    be ready to resend such a chunk through html_to_plain_text without parse_mode.
+    
+    Args:
+        text: The full message text
+        max_length: Maximum length of each chunk (Telegram's limit is 4096)
+    
+    Returns:
+        List of message chunks, in order
+    """
+    if len(text) <= max_length:
+        return [text]
+    
+    chunks = []
+    current = []
+    current_length = 0
+    for line in text.splitlines(keepends=True):
+        while len(line) > max_length:
+            if current:
+                chunks.append("".join(current))
+                current, current_length = [], 0
+            chunks.append(line[:max_length])
+            line = line[max_length:]
+        if current_length + len(line) > max_length:
+            chunks.append("".join(current))
+            current, current_length = [], 0
+        current.append(line)
+        current_length += len(line)
+    if current:
+        chunks.append("".join(current))
+    
+    return chunks
+
+
+def html_to_plain_text(text: str) -> str:
+    """
+    Converts an HTML-formatted message chunk to plain text for sending without parse_mode.
+    
+    Strips tags (including a tag cut off at either edge of the chunk) and unescapes entities.
+    
+    Args:
+        text: Message text formatted for parse_mode="HTML"
+    
+    Returns:
+        The text without markup
+    """
+    return html.unescape(HTML_TAG_PATTERN.sub("", text))
+
+
 async def send_message_with_retry(context: ContextTypes.DEFAULT_TYPE, chat_id: int, text: str, 
                                  parse_mode: Optional[str] = None, 
                                  reply_markup: Optional[Union[InlineKeyboardMarkup, ReplyKeyboardMarkup]] = None,
@@ -7,7 +7,7 @@ from database.adapter import db_adapter
 import telegram
 from telegram.ext import ContextTypes
 
-from config.constants import global_data
+from config.constants import global_data, get_chat_data_for_id
 from config.settings import REFERRAL_BONUS_POINTS, ALLOWED_GROUP_IDS
 from config.messages import (
     ERROR_SELF_REFERRAL, ERROR_USER_DATA_CREATION, ERROR_REFERRER_NOT_FOUND,
@@ -345,19 +345,12 @@ def process_welcome_bonus(user_id: int, chat_id: int, first_name: Optional[str]
             return False, INFO_WELCOME_BONUS_ALREADY_RECEIVED
         
         # Get or create player stats for this chat
-        chat_id_str = str(chat_id)
-        if chat_id_str not in global_data["all_chat_data"]:
-            global_data["all_chat_data"][chat_id_str] = {
-                "player_stats": {},
-                "match_counter": 1,
-                "match_history": [],
-                "group_admins": [],
-                "consecutive_idle_matches": 0
-            }
+        chat_player_stats = get_chat_data_for_id(chat_id)["player_stats"]
         
         user_id_str = str(user_id)
-        if user_id_str not in global_data["all_chat_data"][chat_id_str]["player_stats"]:
-            global_data["all_chat_data"][chat_id_str]["player_stats"][user_id_str] = {
+        player_stats = chat_player_stats.get(user_id_str)
+        if player_stats is None:
+            player_stats = chat_player_stats[user_id_str] = {
                 "username": username or first_name or FALLBACK_USER_NAME.format(user_id=user_id),
                 "score": 0,
                 "total_bets": 0,
@@ -370,7 +363,6 @@ def process_welcome_bonus(user_id: int, chat_id: int, first_name: Optional[str]
         user_data["bonus_points"] = user_data.get("bonus_points", 0) + WELCOME_BONUS_POINTS
         
         # Update player stats
-        player_stats = global_data["all_chat_data"][chat_id_str]["player_stats"][user_id_str]
         player_stats["last_active"] = datetime.now().isoformat()
         
         # Mark welcome bonus as received for this specific chat in database
@@ -378,10 +370,8 @@ def process_welcome_bonus(user_id: int, chat_id: int, first_name: Optional[str]
             mark_welcome_bonus_received(user_id, chat_id)
         
         # Clean up old data from user_data
-        if 'welcome_bonus_received' in user_data:
-            del user_data['welcome_bonus_received']
-        if 'welcome_bonuses_received' in user_data:
-            del user_data['welcome_bonuses_received']
+        user_data.pop('welcome_bonus_received', None)
+        user_data.pop('welcome_bonuses_received', None)
         
         # Save the updated data
         save_data_unified(global_data)